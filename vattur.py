@@ -2,15 +2,62 @@
 # A Discord bot made with Python and passion!
 import discord
 from discord.ext import commands, tasks
-import requests
+import aiohttp
 import logging
 import os
 from telegram import Bot
+from telegram.request import HTTPXRequest
 import asyncio
 import cloudscraper
 import json
-from logging.handlers import TimedRotatingFileHandler
+import mmap
+import re
+from functools import lru_cache
+from logging.handlers import TimedRotatingFileHandler, MemoryHandler, QueueHandler, QueueListener
 import telegram
+import queue
+import atexit
+
+# Prefer a fast C JSON parser for the multi-MB VATSIM feed, fall back to stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
+
+# Hard message-length caps imposed by the platforms
+DISCORD_MSG_LIMIT = 2000
+TELEGRAM_MSG_LIMIT = 4096
+
+# Timeouts so a hung connection can never stall the event loop indefinitely
+DEFAULT_TIMEOUT = (5, 15)  # (connect, read) for synchronous HTTP
+HTTP_TOTAL_TIMEOUT = aiohttp.ClientTimeout(total=20)  # shared aiohttp session
+
+# Nickname formats: "XXXXX YYYYYY - ZZZZZZZ" or "|-ZZZZZZZ-|"
+_CID_RE = re.compile(r' - (\d+)\s*$|\|-(\d+)-\|')
+
+# Discord markdown/shortcodes -> Telegram HTML, compiled once
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_EMOJI_SHORTCODES = {
+    ':globe_with_meridians:': '🌐',
+    ':zzz:': '💤',
+}
+
+def _to_telegram(message: str) -> str:
+    """Convert a Discord-formatted message to Telegram HTML"""
+    for shortcode, emoji in _EMOJI_SHORTCODES.items():
+        message = message.replace(shortcode, emoji)
+    return _BOLD_RE.sub(r'<b>\1</b>', message)
+
+@lru_cache(maxsize=4096)
+def _extract_cid(nickname: str) -> str:
+    """Pull the CID out of a nickname; cached because nicknames rarely change"""
+    match = _CID_RE.search(nickname)
+    if match:
+        return match.group(1) or match.group(2)
+    return None
 
 # Configure logging with rotation
 def setup_logging():
@@ -27,17 +74,26 @@ def setup_logging():
     )
     file_handler.setFormatter(formatter)
     file_handler.suffix = '%Y-%m-%d.log'  # Append date to filename
-    
+
+    # Buffer disk writes; flush every 1024 records or immediately on ERROR
+    memory_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+
     # Set up console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    
+
+    # The bot threads only enqueue records; a background listener thread does
+    # the actual console/disk I/O so logging never blocks the event loop
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, memory_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drain the queue before logging.shutdown flushes the buffer
+
     # Configure root logger
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    logger.addHandler(QueueHandler(log_queue))
+
     return logger
 
 # Initialize both loggers
@@ -48,69 +104,91 @@ class Config:
         self.TOKEN = os.getenv('DISCORD_BOT_TOKEN')
         self.TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
         self.TELEGRAM_CHANNEL_ID = os.getenv('TELEGRAM_CHANNEL_ID')
-        self.GUILD_ID = os.getenv('DISCORD_GUILD_ID')
-        self.CHANNEL_ID = os.getenv('DISCORD_CHANNEL_ID')
+        guild_id = os.getenv('DISCORD_GUILD_ID')
+        if not guild_id:
+            raise ValueError("GUILD_ID environment variable is not set")
+
+        # Parse the IDs once here instead of on every lookup in the hot paths
+        self.GUILD_ID = int(guild_id)
+        self.GUILD_OBJ = discord.Object(id=self.GUILD_ID)
+        self.CHANNEL_ID = int(os.getenv('DISCORD_CHANNEL_ID'))
         self.CHECKWX_API_KEY = os.getenv('CHECKWX_API_KEY')
         self.OWNER_ID = int(os.getenv('DISCORD_OWNER_ID'))
         self.VATEUD_API_KEY = os.getenv('VATEUD_API_KEY')
         self.ROSTER_UPDATE_INTERVAL = 3600
-        
-        if not self.GUILD_ID:
-            raise ValueError("GUILD_ID environment variable is not set")
 
 class WeatherAPI:
-    def __init__(self, api_key):
+    def __init__(self, api_key, session: aiohttp.ClientSession = None):
         self.api_key = api_key
         self.base_url = "https://api.checkwx.com"
-        
+        self.session = session  # Shared aiohttp session, set by the bot on startup
+
     async def get_weather_data(self, airport_code: str, data_type: str) -> dict:
         url = f"{self.base_url}/{data_type}/{airport_code}/decoded"
         headers = {'X-API-Key': self.api_key}
-        
+
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
+            async with self.session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                data = await response.json()
+
             if data and "data" in data and len(data["data"]) > 0:
                 return {"success": True, "data": data["data"][0]["raw_text"]}
             return {"success": False, "error": "No data available"}
-            
-        except requests.RequestException as e:
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Failed to fetch {data_type} for {airport_code}: {e}")
             return {"success": False, "error": str(e)}
 
 class VatsimClient:
-    def __init__(self):
+    def __init__(self, session: aiohttp.ClientSession = None):
         self.api_url = "https://data.vatsim.net/v3/vatsim-data.json"
-        
+        self.session = session  # Shared aiohttp session, set by the bot on startup
+        self._etag = None  # validator from the last successful fetch
+        self._cached_controllers = []
+
     async def get_controllers(self) -> list:
         try:
-            response = requests.get(self.api_url)
-            response.raise_for_status()  # This will raise an exception for bad status codes
-            
+            # Ask for a compressed body, and make the request conditional so an
+            # unchanged feed comes back as a bodyless 304 instead of several MB
+            headers = {'Accept-Encoding': 'gzip, deflate'}
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+
+            async with self.session.get(self.api_url, headers=headers) as response:
+                if response.status == 304:
+                    logger.debug("VATSIM feed unchanged since last poll (304)")
+                    return self._cached_controllers
+                response.raise_for_status()  # This will raise an exception for bad status codes
+                etag = response.headers.get('ETag')
+                content = await response.read()
+
             # Check if response content is empty
-            if not response.content:
+            if not content:
                 logger.error("Empty response received from VATSIM API")
                 return []
-            
-            # Try to parse JSON and handle potential parsing errors
+
+            # Parse in a worker thread; the feed is several MB and decoding it
+            # on the event loop would block everything for the duration
             try:
-                data = response.json()
-            except json.JSONDecodeError as e:
+                data = await asyncio.to_thread(json_loads, content)
+            except ValueError as e:  # covers orjson/ujson/json decode errors
                 logger.error(f"Failed to parse VATSIM API response: {e}")
-                logger.debug(f"Raw response: {response.text[:200]}...")  # Log first 200 chars of response
+                logger.debug("Raw response: %s...", content[:200])  # Log first 200 chars of response
                 return []
-            
+
             # Check if controllers key exists
             controllers = data.get("controllers")
             if controllers is None:
                 logger.error("No 'controllers' key in VATSIM API response")
                 return []
-                
+
+            # Only remember the validator once the payload parsed cleanly
+            self._etag = etag
+            self._cached_controllers = controllers
             return controllers
-            
-        except requests.RequestException as e:
+
+        except aiohttp.ClientError as e:
             logger.error(f"Failed to fetch VATSIM data: {e}")
             return []
         except Exception as e:
@@ -122,28 +200,32 @@ class RosterClient:
         self.api_key = api_key
         self.api_url = "https://core.vateud.net/api/facility/roster"
         self.logger = logging.getLogger()
-        
+        # Reuse one scraper so TLS sessions, cookies and the Cloudflare
+        # clearance survive between hourly roster polls
+        self.scraper = cloudscraper.create_scraper(
+            browser={
+                'browser': 'chrome',
+                'platform': 'linux',
+                'desktop': True
+            }
+        )
+        # Static headers are identical on every poll, so set them once
+        self.scraper.headers.update({
+            'Accept': 'application/json',
+            'X-API-KEY': self.api_key,
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+        })
+
     async def get_roster(self) -> dict:
         try:
             self.logger.info("=== VATEUD API Request ===")
-            scraper = cloudscraper.create_scraper(
-                browser={
-                    'browser': 'chrome',
-                    'platform': 'linux',
-                    'desktop': True
-                }
-            )
-            
-            headers = {
-                'Accept': 'application/json',
-                'X-API-KEY': self.api_key,
-                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-            }
-            
+
             # Log API request without sensitive data
             self.logger.info(f"Making request to VATEUD API")
-            
-            response = scraper.get(self.api_url, headers=headers)
+
+            # cloudscraper is synchronous; run it in a worker thread so the
+            # Discord event loop keeps servicing heartbeats during the request
+            response = await asyncio.to_thread(self.scraper.get, self.api_url, timeout=DEFAULT_TIMEOUT)
             
             # Log API response
             self.logger.info(f"Response Status: {response.status_code}")
@@ -152,7 +234,7 @@ class RosterClient:
                 self.logger.error(f"API Response Error: {response.text[:500]}")
                 raise Exception(f"API request failed with status {response.status_code}")
                 
-            data = response.json()
+            data = json_loads(response.content)
             if not data.get('success'):
                 self.logger.error(f"API Error Response: {data}")
                 raise Exception("API returned error status")
@@ -186,93 +268,118 @@ class VATTurkBot(commands.Bot):
         super().__init__(command_prefix="!", intents=intents)
         
         self.config = config
+        self.http_session = None  # Shared aiohttp session, created in setup_hook
         self.weather_api = WeatherAPI(config.CHECKWX_API_KEY)
         self.vatsim_client = VatsimClient()
         self.roster_client = RosterClient(config.VATEUD_API_KEY)
-        self.telegram_bot = Bot(token=config.TELEGRAM_TOKEN)
+        # Pooled HTTPX client so Telegram sends reuse kept-alive connections
+        self.telegram_bot = Bot(
+            token=config.TELEGRAM_TOKEN,
+            request=HTTPXRequest(connection_pool_size=8, connect_timeout=5, read_timeout=10)
+        )
         
         # Initialize tracking variables
-        self.callsigns = self.load_callsigns('callsigns.txt')
-        self.callsign_status = {callsign: None for callsign in self.callsigns}
+        self.callsigns = self.load_callsigns('callsigns.txt')  # frozenset for O(1) membership
+        self._online = set()  # callsigns currently online on VATSIM
+        self.callsign_status = {}  # transitions recorded by check_vatsim
         self.trvac_roster = set()
         self.last_roster_update = None
-        self.roster_update_task = None
-        self.first_check = True
+        self._roster_failures = 0  # consecutive failed roster updates, drives backoff
+        self._last_our_online_cids = None  # gate for check_controller_status
+        self.cid_to_member = None  # CID -> discord.Member, built on first tick
+        self._role_cids = set()  # CIDs currently holding the controller role
+        self._role_edit_sem = asyncio.Semaphore(10)  # bound concurrent role edits
+
+        # Handles resolved once per connect in on_ready so hot paths are
+        # attribute reads instead of repeated cache lookups
+        self.notify_channel = None
+        self.home_guild = None
+        self.controller_role = None
         
         # Register commands
         self.setup_commands()
 
     @staticmethod
-    def load_callsigns(file_path: str) -> list:
+    def load_callsigns(file_path: str) -> frozenset:
         try:
-            with open(file_path, 'r') as file:
-                return [line.strip() for line in file if line.strip()]
+            with open(file_path, 'rb') as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return frozenset(
+                        line.strip().decode() for line in bytes(mm).splitlines() if line.strip()
+                    )
         except Exception as e:
             logger.error(f"Failed to load callsigns: {e}")
-            return []
+            return frozenset()
 
-    async def send_notification(self, message: str):
-        """Send notification to Discord and Telegram with retry logic"""
+    async def _send_discord(self, message: str):
+        """Send the Discord half of a notification (keeps markdown format)"""
         try:
-            # Discord notification (keep original markdown format)
-            channel = self.get_channel(int(self.config.CHANNEL_ID))
+            channel = self.notify_channel or self.get_channel(self.config.CHANNEL_ID)
             if channel:
                 await channel.send(message)
-                logger.info(f"Attempting to send message to channel {channel.name}: {message}")
+                logger.info("Attempting to send message to channel %s: %s", channel.name, message)
+        except Exception as e:
+            logger.error(f"Failed to send Discord notification: {str(e)}", exc_info=True)
 
-            # Convert Discord formatting to Telegram HTML format
-            telegram_message = message.replace(":globe_with_meridians:", "🌐")  # Globe emoji
-            telegram_message = telegram_message.replace(":zzz:", "💤")  # Sleeping emoji
-            
-            # Convert markdown bold to HTML bold
-            telegram_message = telegram_message.replace("**", "<b>", 1)  # First occurrence
-            telegram_message = telegram_message.replace("**", "</b>", 1)  # Second occurrence
+    async def _send_telegram(self, telegram_message: str):
+        """Send the Telegram half of a notification, retrying on timeouts"""
+        max_retries = 3
+        retry_delay = 5  # seconds
 
-            # Telegram notification with retry logic
-            max_retries = 3
-            retry_delay = 5  # seconds
-            
-            for attempt in range(max_retries):
-                try:
-                    await self.telegram_bot.send_message(
-                        chat_id=self.config.TELEGRAM_CHANNEL_ID,
-                        text=telegram_message,
-                        parse_mode='HTML'
-                    )
-                    logger.info(f"HTTP Request: POST https://api.telegram.org/bot{self.config.TELEGRAM_TOKEN}/sendMessage \"HTTP/1.1 200 OK\"")
-                    break  # Success, exit retry loop
-                    
-                except telegram.error.TimedOut:
-                    if attempt < max_retries - 1:  # Don't sleep on last attempt
-                        logger.warning(f"Telegram notification timed out, attempt {attempt + 1}/{max_retries}. Retrying in {retry_delay} seconds...")
-                        await asyncio.sleep(retry_delay)
-                    else:
-                        logger.error("Failed to send Telegram notification after all retries")
-                        
-                except telegram.error.TelegramError as e:
-                    logger.error(f"Telegram error: {str(e)}")
-                    break  # Don't retry other Telegram errors
-                    
-        except Exception as e:
-            logger.error(f"Failed to send notification: {str(e)}", exc_info=True)
+        for attempt in range(max_retries):
+            try:
+                await self.telegram_bot.send_message(
+                    chat_id=self.config.TELEGRAM_CHANNEL_ID,
+                    text=telegram_message,
+                    parse_mode='HTML'
+                )
+                logger.debug("Telegram sendMessage succeeded on attempt %d", attempt + 1)
+                break  # Success, exit retry loop
+
+            except telegram.error.TimedOut:
+                if attempt < max_retries - 1:  # Don't sleep on last attempt
+                    logger.warning("Telegram notification timed out, attempt %d/%d. Retrying in %d seconds...", attempt + 1, max_retries, retry_delay)
+                    await asyncio.sleep(retry_delay)
+                else:
+                    logger.error("Failed to send Telegram notification after all retries")
+
+            except telegram.error.TelegramError as e:
+                logger.error(f"Telegram error: {str(e)}")
+                break  # Don't retry other Telegram errors
+
+    async def send_notification(self, message: str, telegram_message: str = None):
+        """Send notification to Discord and Telegram concurrently"""
+        # Callers that already know their formatting pass the Telegram
+        # variant directly; otherwise convert the markdown in one pass
+        if telegram_message is None:
+            telegram_message = _to_telegram(message)
+
+        # The two round-trips are independent, so overlap them
+        await asyncio.gather(
+            self._send_discord(message),
+            self._send_telegram(telegram_message),
+            return_exceptions=True
+        )
+
+    @staticmethod
+    def _iter_staff(groups):
+        """Flatten the staff payload, which mixes bare members and member lists"""
+        for group in groups:
+            yield from (group if isinstance(group, list) else (group,))
 
     async def update_roster(self):
         try:
             logger.info("Starting roster update...")
             roster_data = await self.roster_client.get_roster()
-            
+
             if not roster_data:
                 logger.error("Failed to fetch roster data")
                 return False
-                
-            staff_cids = set()
-            for staff_group in roster_data.get('staff', []):
-                if isinstance(staff_group, list):
-                    staff_cids.update(str(member['cid']) for member in staff_group if 'cid' in member)
-                elif 'cid' in staff_group:
-                    staff_cids.add(str(staff_group['cid']))
-            
-            controller_cids = {str(cid) for cid in roster_data.get('controllers', [])}
+
+            staff_cids = {str(member['cid'])
+                          for member in self._iter_staff(roster_data.get('staff', []))
+                          if 'cid' in member}
+            controller_cids = {str(cid) for cid in roster_data.get('controllers', ())}
             self.trvac_roster = staff_cids | controller_cids
             self.last_roster_update = asyncio.get_event_loop().time()
             
@@ -283,16 +390,25 @@ class VATTurkBot(commands.Bot):
             logger.error(f"Error updating roster: {e}")
             return False
 
-    async def schedule_roster_updates(self):
-        """Schedule periodic roster updates"""
-        while True:
-            try:
-                await self.update_roster()
-                # Wait for 1 hour before next update
-                await asyncio.sleep(3600)  # 3600 seconds = 1 hour
-            except Exception as e:
-                logger.error(f"Error in roster update schedule: {e}")
-                await asyncio.sleep(60)  # Wait 1 minute before retrying if there's an error
+    @tasks.loop(seconds=3600)
+    async def roster_loop(self):
+        """Periodic roster refresh with exponential backoff on failure"""
+        try:
+            if await self.update_roster():
+                if self._roster_failures:
+                    self._roster_failures = 0
+                    self.roster_loop.change_interval(seconds=self.config.ROSTER_UPDATE_INTERVAL)
+            else:
+                self._roster_failures += 1
+                retry = min(60 * 2 ** (self._roster_failures - 1), self.config.ROSTER_UPDATE_INTERVAL)
+                logger.warning("Roster update failed, retrying in %d seconds", retry)
+                self.roster_loop.change_interval(seconds=retry)
+        except Exception as e:
+            logger.error(f"Error in roster update schedule: {e}")
+
+    @roster_loop.before_loop
+    async def before_roster_loop(self):
+        await self.wait_until_ready()
 
     @tasks.loop(minutes=1)
     async def check_vatsim(self):
@@ -301,60 +417,100 @@ class VATTurkBot(commands.Bot):
             logger.warning("No controllers data received from VATSIM")
             return
             
-        logger.debug(f"Retrieved {len(controllers)} controllers from VATSIM")
+        logger.debug("Retrieved %d controllers from VATSIM", len(controllers))
         online_callsigns = {ctrl["callsign"]: ctrl for ctrl in controllers}
-        
-        for callsign in self.callsigns:
-            previous_status = self.callsign_status.get(callsign)
-            logger.debug(f"Checking {callsign} (previous status: {previous_status})")
-            
-            if callsign in online_callsigns:
-                controller = online_callsigns[callsign]
-                name = controller.get("name", "Unknown")
-                cid = str(controller.get("cid", "Unknown"))
-                
-                if self.first_check or previous_status != "online":
-                    logger.info(f"Status change detected for {callsign}")
-                    await self.notify_controller_status(callsign, name, cid, "online")
-                    if cid not in self.trvac_roster:
-                        await self.notify_rogue_controller(callsign, name, cid)
-                
-                self.callsign_status[callsign] = "online"
-            elif previous_status == "online":
-                logger.info(f"Controller went offline: {callsign}")
-                await self.notify_controller_status(callsign, "Unknown", "Unknown", "offline")
-                self.callsign_status[callsign] = "offline"
-        
-        self.first_check = False
+        current_online = online_callsigns.keys() & self.callsigns
+
+        # Only touch callsigns whose state actually changed this tick;
+        # collect the changes so the whole tick costs one notification send
+        changes = []  # (discord_line, telegram_line)
+        rogues = []
+
+        for callsign in current_online - self._online:
+            controller = online_callsigns[callsign]
+            name = controller.get("name", "Unknown")
+            cid = str(controller.get("cid", "Unknown"))
 
-    async def notify_controller_status(self, callsign, name, cid, status):
+            logger.info("Status change detected for %s", callsign)
+            changes.append(self._status_lines(callsign, name, cid, "online"))
+            if cid not in self.trvac_roster:
+                rogues.append((callsign, name, cid))
+            self.callsign_status[callsign] = "online"
+
+        for callsign in self._online - current_online:
+            logger.info("Controller went offline: %s", callsign)
+            changes.append(self._status_lines(callsign, "Unknown", "Unknown", "offline"))
+            self.callsign_status[callsign] = "offline"
+
+        self._online = current_online
+
+        for discord_msg, telegram_msg in self._chunk_changes(changes):
+            logger.info(discord_msg)
+            await self.send_notification(discord_msg, telegram_msg)
+
+        # Rogue alerts are rare and high-priority, keep them as separate messages
+        for callsign, name, cid in rogues:
+            await self.notify_rogue_controller(callsign, name, cid)
+
+    @staticmethod
+    def _status_lines(callsign, name, cid, status):
+        """Discord/Telegram message lines for one controller status transition"""
         if status == "online":
-            discord_msg = f":globe_with_meridians: **{callsign}** {name} - {cid} is now online."
-            telegram_msg = f"🌐 {callsign} {name} - {cid} is now online."
-        else:
-            discord_msg = f":zzz: **{callsign}** is now offline."
-            telegram_msg = f"💤 {callsign} is now offline."
-        
-        # Log the status change
-        logger.info(discord_msg)
-        
-        # Send notifications
-        await self.send_notification(discord_msg)
+            return (f":globe_with_meridians: **{callsign}** {name} - {cid} is now online.",
+                    f"🌐 {callsign} {name} - {cid} is now online.")
+        return (f":zzz: **{callsign}** is now offline.",
+                f"💤 {callsign} is now offline.")
+
+    @staticmethod
+    def _chunk_changes(changes):
+        """Join (discord, telegram) line pairs into messages under both caps
+
+        A restart can put dozens of transitions in one tick; a single joined
+        message would blow past Discord's 2000-character limit and the whole
+        batch would be rejected.
+        """
+        chunks = []
+        discord_lines, telegram_lines = [], []
+        discord_len = telegram_len = 0
+
+        for discord_line, telegram_line in changes:
+            # +1 accounts for the joining newline
+            if discord_lines and (discord_len + 1 + len(discord_line) > DISCORD_MSG_LIMIT
+                                  or telegram_len + 1 + len(telegram_line) > TELEGRAM_MSG_LIMIT):
+                chunks.append(("\n".join(discord_lines), "\n".join(telegram_lines)))
+                discord_lines, telegram_lines = [], []
+                discord_len = telegram_len = 0
+
+            if discord_lines:
+                discord_len += 1
+                telegram_len += 1
+            discord_lines.append(discord_line)
+            telegram_lines.append(telegram_line)
+            discord_len += len(discord_line)
+            telegram_len += len(telegram_line)
+
+        if discord_lines:
+            chunks.append(("\n".join(discord_lines), "\n".join(telegram_lines)))
+        return chunks
 
     async def notify_rogue_controller(self, callsign, name, cid):
         warning_msg = (f"⚠️ **ROGUE CONNECTION DETECTED**\n"
                       f"Controller: {callsign} ({name})\n"
                       f"CID: {cid}\n"
                       f"This controller is not in the vACC roster!")
-        
+        telegram_msg = (f"⚠️ <b>ROGUE CONNECTION DETECTED</b>\n"
+                        f"Controller: {callsign} ({name})\n"
+                        f"CID: {cid}\n"
+                        f"This controller is not in the vACC roster!")
+
         # Log the rogue controller detection
-        logger.warning(f"Rogue controller detected: {callsign} ({cid})")
-        
+        logger.warning("Rogue controller detected: %s (%s)", callsign, cid)
+
         # Send notifications
-        await self.send_notification(warning_msg)
+        await self.send_notification(warning_msg, telegram_msg)
 
     def setup_commands(self):
-        @self.tree.command(name="metar", description="Fetch METAR data", guild=discord.Object(id=self.config.GUILD_ID))
+        @self.tree.command(name="metar", description="Fetch METAR data", guild=self.config.GUILD_OBJ)
         async def metar(interaction: discord.Interaction, airport_code: str):
             await interaction.response.defer(ephemeral=True)
             result = await self.weather_api.get_weather_data(airport_code.upper(), "metar")
@@ -364,7 +520,7 @@ class VATTurkBot(commands.Bot):
             else:
                 await interaction.followup.send(f"Failed to fetch METAR: {result['error']}")
 
-        @self.tree.command(name="taf", description="Fetch TAF data", guild=discord.Object(id=self.config.GUILD_ID))
+        @self.tree.command(name="taf", description="Fetch TAF data", guild=self.config.GUILD_OBJ)
         async def taf(interaction: discord.Interaction, airport_code: str):
             await interaction.response.defer(ephemeral=True)
             result = await self.weather_api.get_weather_data(airport_code.upper(), "taf")
@@ -374,13 +530,13 @@ class VATTurkBot(commands.Bot):
             else:
                 await interaction.followup.send(f"Failed to fetch TAF: {result['error']}")
 
-        @self.tree.command(name="status", description="Check controller status", guild=discord.Object(id=self.config.GUILD_ID))
+        @self.tree.command(name="status", description="Check controller status", guild=self.config.GUILD_OBJ)
         async def status(interaction: discord.Interaction, callsign: str):
             await interaction.response.defer(ephemeral=True)
             status = self.callsign_status.get(callsign.upper(), "unknown")
             await interaction.followup.send(f"Controller {callsign.upper()} is currently {status}.")
 
-        @self.tree.command(name="shutdown", description="Shut down the bot", guild=discord.Object(id=self.config.GUILD_ID))
+        @self.tree.command(name="shutdown", description="Shut down the bot", guild=self.config.GUILD_OBJ)
         async def shutdown(interaction: discord.Interaction):
             if interaction.user.id == self.config.OWNER_ID:
                 await interaction.response.send_message("Shutting down...")
@@ -393,24 +549,79 @@ class VATTurkBot(commands.Bot):
         1. 'XXXXX YYYYYY - ZZZZZZZ'
         2. '|-ZZZZZZZ-|'
         """
-        try:
-            if not nickname:
-                return None
-            
-            if ' - ' in nickname:
-                # Format: "XXXXX YYYYYY - ZZZZZZZ"
-                cid = nickname.split(' - ')[-1].strip()
-                if cid.isdigit():
-                    return cid
-            elif '|-' in nickname and '-|' in nickname:
-                # Format: "|-ZZZZZZZ-|"
-                cid = nickname.replace('|-', '').replace('-|', '').strip()
-                if cid.isdigit():
-                    return cid
-                
-        except Exception as e:
-            logger.error(f"Error extracting CID from nickname '{nickname}': {e}")
-        return None
+        if not nickname:
+            return None
+        return _extract_cid(nickname)
+
+    def _build_member_index(self, guild, controller_role):
+        """One-off walk of the member cache to build the CID -> member index"""
+        self.cid_to_member = {}
+        self._role_cids = set()
+        for member in guild.members:
+            cid = self.extract_cid(member.nick)
+            if not cid:
+                continue
+            self.cid_to_member[cid] = member
+            if controller_role in member.roles:
+                self._role_cids.add(cid)
+        logger.info(f"Indexed {len(self.cid_to_member)} members with a CID in their nickname")
+
+    async def on_member_join(self, member):
+        if self.cid_to_member is None:
+            return
+        cid = self.extract_cid(member.nick)
+        if cid:
+            self.cid_to_member[cid] = member
+            # The member may already be online, so force a re-evaluation
+            self._last_our_online_cids = None
+
+    async def on_member_remove(self, member):
+        if self.cid_to_member is None:
+            return
+        cid = self.extract_cid(member.nick)
+        if cid:
+            self.cid_to_member.pop(cid, None)
+            self._role_cids.discard(cid)
+            self._last_our_online_cids = None
+
+    async def on_member_update(self, before, after):
+        """Keep the CID index and role-holder set in sync with nickname/role edits"""
+        if self.cid_to_member is None:
+            return
+        if before.nick != after.nick:
+            old_cid = self.extract_cid(before.nick)
+            if old_cid:
+                self.cid_to_member.pop(old_cid, None)
+                self._role_cids.discard(old_cid)
+                self._last_our_online_cids = None
+        cid = self.extract_cid(after.nick)
+        if cid:
+            self.cid_to_member[cid] = after
+            if any(role.id == self.CONTROLLER_ROLE_ID for role in after.roles):
+                self._role_cids.add(cid)
+            else:
+                self._role_cids.discard(cid)
+            # Index or role holders changed, so the unchanged-set gate in
+            # check_controller_status must not skip the next tick
+            self._last_our_online_cids = None
+
+    async def _apply_role_change(self, member, cid, controller_role, add):
+        """Add or remove the controller role for one member, bounded by the semaphore"""
+        async with self._role_edit_sem:
+            try:
+                if add:
+                    await member.add_roles(controller_role)
+                    self._role_cids.add(cid)
+                    logger.info("Added controller role to %s (CID: %s)", member.nick, cid)
+                else:
+                    await member.remove_roles(controller_role)
+                    self._role_cids.discard(cid)
+                    logger.info("Removed controller role from %s (CID: %s)", member.nick, cid)
+                self.role_error_logged.pop(member.id, None)
+            except discord.Forbidden as e:
+                if member.id not in self.role_error_logged:
+                    logger.error(f"Permission error for {member.nick}: {str(e)}")
+                    self.role_error_logged[member.id] = True
 
     @tasks.loop(minutes=1)
     async def check_controller_status(self):
@@ -418,12 +629,9 @@ class VATTurkBot(commands.Bot):
             if not self.is_ready():
                 await self.wait_until_ready()
 
-            guild = self.get_guild(int(self.config.GUILD_ID))
-            if not guild:
-                return
-
-            controller_role = guild.get_role(self.CONTROLLER_ROLE_ID)
-            if not controller_role:
+            guild = self.home_guild
+            controller_role = self.controller_role
+            if not guild or not controller_role:
                 return
 
             controllers = await self.vatsim_client.get_controllers()
@@ -436,41 +644,55 @@ class VATTurkBot(commands.Bot):
                 if ctrl['callsign'] in self.callsigns
             }
             
-            logger.debug(f"Our online controllers: {len(our_online_cids)} with callsigns from our list")
+            logger.debug("Our online controllers: %d with callsigns from our list", len(our_online_cids))
 
-            for member in guild.members:
-                if not member.nick:
-                    continue
+            if self.cid_to_member is None:
+                self._build_member_index(guild, controller_role)
 
-                member_cid = self.extract_cid(member.nick)
-                if not member_cid:
+            # No controllers came online or went offline since the last tick,
+            # so every member's role is already correct - nothing to do
+            if our_online_cids == self._last_our_online_cids:
+                return
+
+            # Queue up only the members whose role actually needs to change,
+            # then dispatch all REST edits concurrently
+            edits = []
+            for cid in our_online_cids - self._role_cids:
+                member = self.cid_to_member.get(cid)
+                if member:
+                    edits.append(self._apply_role_change(member, cid, controller_role, add=True))
+
+            for cid in self._role_cids - our_online_cids:
+                member = self.cid_to_member.get(cid)
+                if not member:
+                    self._role_cids.discard(cid)
                     continue
+                edits.append(self._apply_role_change(member, cid, controller_role, add=False))
+
+            edits_failed = False
+            if edits:
+                results = await asyncio.gather(*edits, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        edits_failed = True
+                        logger.error(f"Role edit failed: {result}", exc_info=result)
 
-                try:
-                    # Check if member is online with one of our callsigns
-                    is_online = member_cid in our_online_cids
-                    has_role = controller_role in member.roles
-
-                    if is_online and not has_role:
-                        await member.add_roles(controller_role)
-                        logger.info(f"Added controller role to {member.nick} (CID: {member_cid})")
-                        self.role_error_logged.pop(member.id, None)
-                    elif not is_online and has_role:
-                        await member.remove_roles(controller_role)
-                        logger.info(f"Removed controller role from {member.nick} (CID: {member_cid})")
-                        self.role_error_logged.pop(member.id, None)
-
-                except discord.Forbidden as e:
-                    if member.id not in self.role_error_logged:
-                        logger.error(f"Permission error for {member.nick}: {str(e)}")
-                        self.role_error_logged[member.id] = True
+            # Only arm the unchanged-set gate when every edit landed, so a
+            # failed edit is retried on the next tick like the full rescan was
+            if not edits_failed:
+                self._last_our_online_cids = our_online_cids
 
         except Exception as e:
             logger.error(f"Error in check_controller_status: {e}", exc_info=True)
 
     async def setup_hook(self):
         """Verify permissions and role hierarchy during startup"""
-        await self.tree.sync(guild=discord.Object(id=self.config.GUILD_ID))
+        # Create the shared HTTP session so API calls never block the event loop
+        self.http_session = aiohttp.ClientSession(timeout=HTTP_TOTAL_TIMEOUT)
+        self.weather_api.session = self.http_session
+        self.vatsim_client.session = self.http_session
+
+        await self.tree.sync(guild=self.config.GUILD_OBJ)
         
         # Debug log to see all config variables
         logger.info("Available config variables:")
@@ -478,7 +700,7 @@ class VATTurkBot(commands.Bot):
             logger.info(f"  - {var}")
         
         # Check permissions and roles once during startup
-        guild = self.get_guild(int(self.config.GUILD_ID))
+        guild = self.get_guild(self.config.GUILD_ID)
         if guild:
             bot_member = guild.get_member(self.user.id)
             if bot_member:
@@ -500,12 +722,16 @@ class VATTurkBot(commands.Bot):
         logger.info("Starting bot tasks...")
         self.check_controller_status.start()
         self.check_vatsim.start()
-        
-        # Create task for roster updates
-        self.loop.create_task(self.schedule_roster_updates())
-        
+        self.roster_loop.start()
+
         logger.info("All tasks started successfully")
 
+    async def close(self):
+        """Close the shared HTTP session before shutting down"""
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+        await super().close()
+
     # Add these error handlers
     async def on_error(self, event_method: str, *args, **kwargs):
         logger.error(f'Error in {event_method}:', exc_info=True)
@@ -523,6 +749,25 @@ class VATTurkBot(commands.Bot):
         logger.info(f'Bot logged in as {self.user.name}')
         logger.info(f'Connected to guilds: {[g.name for g in self.guilds]}')
 
+        # Resolve the frequently used handles now that the cache is populated;
+        # warning here once beats silently dropping notifications later
+        self.notify_channel = self.get_channel(self.config.CHANNEL_ID)
+        if self.notify_channel is None:
+            logger.warning(f"Notification channel {self.config.CHANNEL_ID} not found in cache")
+
+        self.home_guild = self.get_guild(self.config.GUILD_ID)
+        if self.home_guild is None:
+            logger.warning(f"Guild {self.config.GUILD_ID} not found in cache")
+        else:
+            self.controller_role = self.home_guild.get_role(self.CONTROLLER_ROLE_ID)
+            if self.controller_role is None:
+                logger.warning(f"Controller role {self.CONTROLLER_ROLE_ID} not found in guild")
+
+    async def on_guild_role_update(self, before, after):
+        """Keep the cached controller role handle current"""
+        if after.id == self.CONTROLLER_ROLE_ID:
+            self.controller_role = after
+
     def run(self):
         while True:
             try: